@@ -1,16 +1,53 @@
 import bpy
 import json
+import math
 import os
+import re
 import sys
 import traceback
 
+# Prefer a C-accelerated JSON parser when one is available in Blender's Python
+try:
+    import orjson
+    _fast_loads = orjson.loads
+except ImportError:
+    orjson = None
+    try:
+        import ujson
+        _fast_loads = ujson.loads
+    except ImportError:
+        _fast_loads = None
+
+def _loads(data):
+    """Parse JSON bytes, falling back to the json module for input the fast parser rejects"""
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(data)
+        except ValueError:
+            # orjson rejects NaN/Infinity literals and non-UTF-8 text that json accepts
+            pass
+    return json.loads(data)
+
+# Optional streaming parser for very large config files
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Trailing "_Config" marker stripped from config file names to get the object name
+_CONFIG_SUFFIX = re.compile(r"_config$", re.IGNORECASE)
+
 # Enable detailed debugging
 DEBUG = True
 
-def debug_print(message):
-    """Print debug messages"""
-    if DEBUG:
+# Bind debug_print once so disabled debugging costs no per-call branch
+if DEBUG:
+    def debug_print(message):
+        """Print debug messages"""
         print(f"DEBUG: {message}")
+else:
+    def debug_print(message):
+        """Debugging is disabled, ignore the message"""
 
 # ===== USER CONFIGURATION =====
 # Set this to the path of your config file to use a specific file
@@ -19,9 +56,88 @@ def debug_print(message):
 CONFIG_PATH = None
 # =============================
 
-def load_config_file(filepath):
-    """Load a config file and create nodes and materials"""
-    debug_print(f"Attempting to load config file: {filepath}")
+# Config files larger than this (in bytes) are streamed with ijson when it is installed and orjson is not
+STREAMING_THRESHOLD = 1_000_000
+
+# Key in bpy.app.driver_namespace holding parsed configs, which survives re-running
+# the script from the Text Editor for the rest of the Blender session
+_PARSE_CACHE_KEY = "config_to_blender_parse_cache"
+
+def _parse_config_cached(filepath, mtime_ns, size):
+    """Read and parse a config file, reusing the last parse until its mtime or size changes
+
+    The returned data is shared between runs, so callers must not modify it.
+    """
+    cache = bpy.app.driver_namespace.setdefault(_PARSE_CACHE_KEY, {})
+    path = os.path.abspath(filepath)
+    stamp = (mtime_ns, size)
+
+    entry = cache.get(path)
+    if entry is not None and entry[0] == stamp:
+        debug_print("Using cached parse of unchanged config file")
+        return entry[1]
+
+    # Large files are streamed when orjson is unavailable. This lowers peak memory
+    # but parses slower than json.loads, so the result is cached like any other
+    if ijson is not None and orjson is None and size > STREAMING_THRESHOLD:
+        config_data = _parse_config_streaming(filepath)
+    else:
+        with open(filepath, 'rb') as f:
+            config_data = _loads(f.read())
+
+    # One entry per file, replaced whenever the file changes
+    cache[path] = (stamp, config_data)
+    return config_data
+
+def _parse_config_streaming(filepath):
+    """Stream a large config file, keeping only the sections the script uses
+
+    The config section is built in full since every parameter becomes a socket.
+    For a dict of parts only the part names are kept, and other sections are
+    never built. Input ijson rejects, such as NaN or Infinity, is parsed in memory.
+    """
+    if DEBUG:
+        debug_print(f"Streaming large config file with ijson: {filepath}")
+    config_data = {}
+    builder = None      # Builds the config (or a non-dict parts) section
+    building = None     # Name of the section being built
+
+    with open(filepath, 'rb') as f:
+        try:
+            # Read every event to the end of the file so malformed JSON is still reported
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == building and event in ('end_map', 'end_array'):
+                        config_data[building] = builder.value
+                        builder = None
+                elif prefix == 'parts' and event == 'start_map':
+                    # Only the part names are used for materials, so skip their contents
+                    part_names = config_data["parts"] = {}
+                elif prefix == 'parts' and event == 'map_key':
+                    part_names[value] = None
+                elif prefix in ('config', 'parts'):
+                    if event in ('start_map', 'start_array'):
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                        building = prefix
+                    elif event not in ('map_key', 'end_map'):
+                        config_data[prefix] = value
+        except ijson.JSONError as e:
+            if DEBUG:
+                debug_print(f"ijson could not stream the file ({e}), parsing it in memory")
+            f.seek(0)
+            return _loads(f.read())
+
+    return config_data
+
+def load_config_file(filepath, obj=None):
+    """Load a config file and create nodes and materials, assigning the materials to obj (the active object by default)"""
+    if obj is None:
+        obj = bpy.context.active_object
+
+    if DEBUG:
+        debug_print(f"Attempting to load config file: {filepath}")
 
     # Check if file exists
     if not os.path.exists(filepath):
@@ -30,25 +146,33 @@ def load_config_file(filepath):
 
     try:
         debug_print("Opening file...")
-        with open(filepath, 'r') as f:
-            try:
-                debug_print("Parsing JSON...")
-                config_data = json.load(f)
+        st = os.stat(filepath)
+        try:
+            debug_print("Parsing JSON...")
+            config_data = _parse_config_cached(filepath, st.st_mtime_ns, st.st_size)
+            if DEBUG:
                 debug_print(f"JSON loaded successfully. Keys: {list(config_data.keys())}")
-            except json.JSONDecodeError as e:
-                print(f"ERROR: Invalid JSON in config file: {e}")
-                return None
+        except ValueError as e:
+            # json raises a ValueError subclass on bad input
+            print(f"ERROR: Invalid JSON in config file: {e}")
+            return None
 
         # Get the object name from the file path
         filename = os.path.basename(filepath)
-        object_name = os.path.splitext(filename)[0].replace("_Config", "").replace("_config", "")
-        debug_print(f"Object name: {object_name}")
+        object_name = _CONFIG_SUFFIX.sub("", os.path.splitext(filename)[0])
+        if DEBUG:
+            debug_print(f"Object name: {object_name}")
 
         # Check if config section exists
         if "config" not in config_data:
             print("ERROR: No 'config' section found in the JSON file")
             return None
 
+        # Look up the sections and their sizes once
+        parts_data = config_data.get("parts")
+        num_parts = len(parts_data) if parts_data is not None else 0
+        num_params = len(config_data["config"])
+
         # Create node group for parameters
         debug_print("Creating parameter node group...")
         node_group = create_parameter_node_group(config_data, object_name)
@@ -57,16 +181,18 @@ def load_config_file(filepath):
             print("ERROR: Failed to create node group")
             return None
 
-        debug_print(f"Node group created successfully: {node_group.name}")
+        if DEBUG:
+            debug_print(f"Node group created successfully: {node_group.name}")
 
         # Create simple materials for parts
-        if "parts" in config_data:
-            debug_print(f"Creating materials for {len(config_data['parts'])} parts...")
-            materials = create_simple_materials(config_data["parts"], object_name)
+        if parts_data is not None:
+            if DEBUG:
+                debug_print(f"Creating materials for {num_parts} parts...")
+            materials = create_simple_materials(parts_data, object_name)
 
-            # Assign materials to the active object if one exists
-            if materials and bpy.context.active_object:
-                assign_materials_to_object(materials, bpy.context.active_object)
+            # Assign materials to the object if one exists
+            if materials and obj:
+                assign_materials_to_object(materials, obj)
 
             debug_print("Materials created successfully")
         else:
@@ -75,28 +201,133 @@ def load_config_file(filepath):
         # Print summary
         print(f"\n{object_name} Configuration Loaded:")
         print(f"- Created node group: {node_group.name}")
-        print(f"- Parameters created for {len(config_data['config'])} values")
-        if "parts" in config_data:
-            print(f"- Materials created: {len(config_data['parts'])}")
+        print(f"- Parameters created for {num_params} values")
+        if parts_data is not None:
+            print(f"- Materials created: {num_parts}")
 
         return node_group
 
     except Exception as e:
         print(f"ERROR loading config file: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
+        traceback.print_exc()
         return None
 
+# ===== PARAMETER HANDLERS =====
+# Each handler describes the socket, menu node and custom properties for one
+# config parameter by appending to the sockets, menus and properties lists:
+#   sockets:    (name, socket_type, min_value, max_value, default_value)
+#   menus:      (name, options, y_offset)
+#   properties: (property_name, value)
+
+def _handle_range(param_name, param_data, y_offset, sockets, menus, properties):
+    """Numeric parameter with a range, as an int or float socket"""
+    min_val, max_val = param_data["range"][:2]
+
+    # NaN or infinite bounds cannot make a usable socket range or default
+    if not (math.isfinite(min_val) and math.isfinite(max_val)):
+        print(f"ERROR: Parameter {param_name} has a non-finite range [{min_val}, {max_val}], skipping it")
+        return
+
+    # Check if both values are integers (floats like 2.0 count)
+    min_type, max_type = type(min_val), type(max_val)
+    are_integers = (min_type is int or (min_type is float and min_val.is_integer())) and \
+                   (max_type is int or (max_type is float and max_val.is_integer()))
+
+    if are_integers:
+        # Use integer socket
+        min_val = int(min_val)
+        max_val = int(max_val)
+        default_val = min_val  # Default to minimum value for integers
+
+        if DEBUG:
+            debug_print(f"Adding int socket: {param_name}, range: [{min_val}, {max_val}], default: {default_val}")
+
+        sockets.append((param_name, 'NodeSocketInt', min_val, max_val, default_val))
+    else:
+        # Use float socket
+        min_val = float(min_val)
+        max_val = float(max_val)
+        default_val = (min_val + max_val) / 2  # Set default to middle of range for floats
+
+        if DEBUG:
+            debug_print(f"Adding float socket: {param_name}, range: [{min_val}, {max_val}], default: {default_val}")
+
+        sockets.append((param_name, 'NodeSocketFloat', min_val, max_val, default_val))
+
+def _handle_count(param_name, param_data, y_offset, sockets, menus, properties):
+    """Count parameter (like Button Count), as an int socket"""
+    min_val, max_val = param_data["count"][:2]
+    min_val = int(min_val)
+    max_val = int(max_val)
+    default_val = min_val  # Default to minimum value
+
+    if DEBUG:
+        debug_print(f"Adding int socket for count: {param_name}, range: [{min_val}, {max_val}], default: {default_val}")
+
+    sockets.append((param_name, 'NodeSocketInt', min_val, max_val, default_val))
+
+def _handle_string_list(param_name, param_data, y_offset, sockets, menus, properties):
+    """String options, as a menu socket driving a menu switch node"""
+    sockets.append((param_name, 'NodeSocketMenu', None, None, None))
+    menus.append((param_name, param_data, y_offset))
+
+    # Store the options as a custom property for reference
+    properties.append(("menu_options_" + param_name, ",".join(map(str, param_data))))
+
+def _handle_bool_list(param_name, param_data, y_offset, sockets, menus, properties):
+    """Boolean options, as a bool socket defaulting to the first value"""
+    sockets.append((param_name, 'NodeSocketBool', None, None, param_data[0]))
+
+    # Store the boolean options as a custom property
+    properties.append(("bool_options_" + param_name, ",".join(map(str, param_data))))
+    if DEBUG:
+        debug_print(f"Adding boolean socket for {param_name} with options: {param_data}")
+
+def _handle_int_list(param_name, param_data, y_offset, sockets, menus, properties):
+    """Other non-string options, as an int socket indexing the options"""
+    sockets.append((param_name, 'NodeSocketInt', 0, len(param_data) - 1, 0))
+
+    # Store the enum options as a custom property on the node group
+    properties.append(("enum_options_" + param_name, ",".join(map(str, param_data))))
+    if DEBUG:
+        debug_print(f"Adding int socket for {param_name} with {len(param_data)} options")
+
+# Dict parameters are dispatched on the first key present, in this order
+_DICT_HANDLERS = {
+    "range": _handle_range,
+    "count": _handle_count,
+}
+
+# List parameters are dispatched on the kind of items they hold
+_LIST_HANDLERS = {
+    str: _handle_string_list,
+    bool: _handle_bool_list,
+    int: _handle_int_list,
+}
+
+def _list_kind(param_data):
+    """Classify list options as str (any strings), bool (only booleans) or int (anything else)"""
+    item_types = set(map(type, param_data))
+    if str in item_types:
+        return str
+    if item_types <= {bool}:
+        return bool
+    return int
+
 def create_parameter_node_group(config_data, object_name):
     """Create a node group for the parameters in the config"""
     try:
         # Create a name for the node group - just the object name as requested
         node_group_name = object_name
-        debug_print(f"Creating node group: {node_group_name}")
+        if DEBUG:
+            debug_print(f"Creating node group: {node_group_name}")
 
         # Check if the node group already exists
-        if node_group_name in bpy.data.node_groups:
-            debug_print(f"Node group {node_group_name} already exists, removing it")
-            bpy.data.node_groups.remove(bpy.data.node_groups[node_group_name])
+        existing_group = bpy.data.node_groups.get(node_group_name)
+        if existing_group is not None:
+            if DEBUG:
+                debug_print(f"Node group {node_group_name} already exists, removing it")
+            bpy.data.node_groups.remove(existing_group)
 
         # Create a new node group
         debug_print("Creating new node group")
@@ -122,197 +353,129 @@ def create_parameter_node_group(config_data, object_name):
 
         # Process parameters from the config file
         if "config" in config_data:
-            debug_print(f"Processing {len(config_data['config'])} parameters")
+            if DEBUG:
+                debug_print(f"Processing {len(config_data['config'])} parameters")
             y_offset = 0
 
+            # First pass: describe every socket, menu node and custom property
+            # without touching Blender, so the interface is built in one go
+            sockets = []
+            menus = []
+            properties = []
+
             for param_name, param_data in config_data["config"].items():
-                debug_print(f"Processing parameter: {param_name}, data: {param_data}")
+                if DEBUG:
+                    debug_print(f"Processing parameter: {param_name}, data: {param_data}")
 
                 if isinstance(param_data, dict):
-                    if "range" in param_data:
-                        # This is a numeric parameter with a range
-                        # Check if the values are integers or floats
-                        min_val = param_data["range"][0]
-                        max_val = param_data["range"][1]
-
-                        # Check if both values are integers
-                        are_integers = (isinstance(min_val, int) and isinstance(max_val, int)) or \
-                                      (min_val == int(min_val) and max_val == int(max_val))
-
-                        if are_integers:
-                            # Use integer socket
-                            min_val = int(min_val)
-                            max_val = int(max_val)
-                            default_val = min_val  # Default to minimum value for integers
-
-                            debug_print(f"Adding int socket: {param_name}, range: [{min_val}, {max_val}], default: {default_val}")
-
-                            socket = node_group.interface.new_socket(
-                                name=param_name,
-                                in_out='INPUT',
-                                socket_type='NodeSocketInt'
-                            )
-                        else:
-                            # Use float socket
-                            min_val = float(min_val)
-                            max_val = float(max_val)
-                            default_val = (min_val + max_val) / 2  # Set default to middle of range for floats
-
-                            debug_print(f"Adding float socket: {param_name}, range: [{min_val}, {max_val}], default: {default_val}")
-
-                            socket = node_group.interface.new_socket(
-                                name=param_name,
-                                in_out='INPUT',
-                                socket_type='NodeSocketFloat'
-                            )
-
-                        # Set the min, max, and default values
-                        socket.min_value = min_val
-                        socket.max_value = max_val
-                        socket.default_value = default_val
-
-                    elif "count" in param_data:
-                        # This is a count parameter (like Button Count)
-                        min_val = int(param_data["count"][0])
-                        max_val = int(param_data["count"][1])
-                        default_val = min_val  # Default to minimum value
-
-                        debug_print(f"Adding int socket for count: {param_name}, range: [{min_val}, {max_val}], default: {default_val}")
-
-                        # Create the interface socket for this parameter
-                        socket = node_group.interface.new_socket(
-                            name=param_name,
-                            in_out='INPUT',
-                            socket_type='NodeSocketInt'
-                        )
-
-                        # Set the min, max, and default values
-                        socket.min_value = min_val
-                        socket.max_value = max_val
-                        socket.default_value = default_val
-
-                # Replace the existing elif isinstance(param_data, list): section with this:
-
+                    handler = next((h for key, h in _DICT_HANDLERS.items() if key in param_data), None)
                 elif isinstance(param_data, list):
-                    # This is a categorical parameter (enum)
-                    debug_print(f"Processing list parameter: {param_name}, options: {param_data}")
-
-                    # Check if this list contains strings (not booleans)
-                    has_strings = any(isinstance(item, str) for item in param_data)
-
-                    if has_strings:
-                        # Create menu switch node for string-based options
-                        debug_print(f"Creating menu switch node for: {param_name}")
-
-                        # Create a menu socket
-                        socket = node_group.interface.new_socket(
-                            name=param_name,
-                            in_out='INPUT',
-                            socket_type='NodeSocketMenu'
-                        )
-
-                        # Create a menu switch node
-                        menu_switch_node = node_group.nodes.new("GeometryNodeMenuSwitch")
-                        menu_switch_node.name = f"MenuSwitch_{param_name}"
-                        menu_switch_node.label = param_name
-                        menu_switch_node.location = (0, y_offset)
-
-                        # Set the data type to String for string options
-                        menu_switch_node.data_type = 'GEOMETRY'
-
-                        # Clear existing enum items and add our options
-                        menu_switch_node.enum_definition.enum_items.clear()
-                        for i, option in enumerate(param_data):
-                            if isinstance(option, str):
-                                item = menu_switch_node.enum_definition.enum_items.new(str(option))
-                                item.name = str(option)
-                                item.description = f"{param_name} option: {option}"
-
-                        # Connect the input socket to the menu switch node
-                        node_group.links.new(
-                            input_node.outputs[param_name],
-                            menu_switch_node.inputs['Menu']
-                        )
-
-                        # Store the options as a custom property for reference
-                        node_group["menu_options_" + param_name] = ",".join(str(item) for item in param_data)
-                        debug_print(f"Created menu switch node for {param_name} with {len(param_data)} string options")
-
-                    else:
-                        # Check if this is a boolean list
-                        has_booleans = all(isinstance(item, bool) for item in param_data)
-
-                        if has_booleans:
-                            # For boolean lists, use boolean socket
-                            socket = node_group.interface.new_socket(
-                                name=param_name,
-                                in_out='INPUT',
-                                socket_type='NodeSocketBool'
-                            )
-
-                            # Set default to first boolean value
-                            socket.default_value = param_data[0]
-
-                            # Store the boolean options as a custom property
-                            node_group["bool_options_" + param_name] = ",".join(str(item) for item in param_data)
-                            debug_print(f"Created boolean socket for {param_name} with options: {param_data}")
-                        else:
-                            # For other non-string lists, use integer socket
-                            socket = node_group.interface.new_socket(
-                                name=param_name,
-                                in_out='INPUT',
-                                socket_type='NodeSocketInt'
-                            )
-
-                            # Set the min, max, and default values
-                            socket.min_value = 0
-                            socket.max_value = len(param_data) - 1
-                            socket.default_value = 0  # Default to first option
-
-                            # Store the enum options as a custom property on the node group
-                            node_group["enum_options_" + param_name] = ",".join(str(item) for item in param_data)
-                            debug_print(f"Created int socket for {param_name} with {len(param_data)} options")
+                    handler = _LIST_HANDLERS[_list_kind(param_data)]
+                else:
+                    handler = None
 
+                if handler is not None:
+                    handler(param_name, param_data, y_offset, sockets, menus, properties)
 
                 y_offset -= 50
 
-        debug_print(f"Node group created with {len(node_group.interface.items_tree)} interface items")
+            # Second pass: create all interface sockets in a single tight loop
+            new_socket = node_group.interface.new_socket
+            for name, socket_type, min_val, max_val, default_val in sockets:
+                socket = new_socket(name=name, in_out='INPUT', socket_type=socket_type)
+
+                # Set the min, max, and default values where the parameter defines them
+                if min_val is not None:
+                    socket.min_value = min_val
+                    socket.max_value = max_val
+                if default_val is not None:
+                    socket.default_value = default_val
+
+            # Third pass: create the menu switch nodes once the interface is complete
+            new_node = node_group.nodes.new
+            links_new = node_group.links.new
+            for param_name, param_data, node_y in menus:
+                if DEBUG:
+                    debug_print(f"Creating menu switch node for: {param_name}")
+
+                # Create a menu switch node
+                menu_switch_node = new_node("GeometryNodeMenuSwitch")
+                menu_switch_node.name = f"MenuSwitch_{param_name}"
+                menu_switch_node.label = param_name
+                menu_switch_node.location = (0, node_y)
+
+                # Set the data type to String for string options
+                menu_switch_node.data_type = 'GEOMETRY'
+
+                # Clear existing enum items and add our options
+                enum_items = menu_switch_node.enum_definition.enum_items
+                enum_items.clear()
+                for option in param_data:
+                    if isinstance(option, str):
+                        item = enum_items.new(option)
+                        item.name = option
+                        item.description = f"{param_name} option: {option}"
+
+                # Connect the input socket to the menu switch node
+                links_new(
+                    input_node.outputs[param_name],
+                    menu_switch_node.inputs['Menu']
+                )
+
+                if DEBUG:
+                    debug_print(f"Created menu switch node for {param_name} with {len(param_data)} string options")
+
+            # Store the option lists as custom properties for reference
+            for prop_name, value in properties:
+                node_group[prop_name] = value
+
+        if DEBUG:
+            debug_print(f"Node group created with {len(node_group.interface.items_tree)} interface items")
         return node_group
 
     except Exception as e:
         print(f"ERROR creating parameter node group: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
+        traceback.print_exc()
         return None
 
 def create_simple_materials(parts_data, object_name):
     """Create simple materials for each part in the config"""
     try:
-        print(f"Creating materials for {len(parts_data)} parts: {list(parts_data.keys())}")
+        part_names = list(parts_data)
+        print(f"Creating materials for {len(part_names)} parts: {part_names}")
 
         # List existing materials before creating new ones
         existing_materials = list(bpy.data.materials.keys())
         print(f"Existing materials before creation: {existing_materials}")
 
+        # Diff against the existing names up front, keeping the part order for material slots
+        existing_names = set(existing_materials)
+        missing_names = [name for name in part_names if name not in existing_names]
+
         materials_created = []
 
-        for part_name in parts_data.keys():
+        # Nothing to do when every part already has a material (e.g. re-running after editing parameters)
+        if not missing_names:
+            print("All part materials already exist, skipping creation")
+            return materials_created
+
+        skipped = len(part_names) - len(missing_names)
+        if skipped:
+            print(f"{skipped} materials already exist, skipping them")
+
+        for part_name in missing_names:
             # Create a material name based on the part name
             material_name = part_name
             print(f"Attempting to create material: {material_name}")
 
-            # Check if the material already exists
-            if material_name in bpy.data.materials:
-                print(f"Material {material_name} already exists, skipping")
-                continue
-            else:
-                try:
-                    # Create a new material with default settings
-                    mat = bpy.data.materials.new(name=material_name)
-                    mat.use_nodes = True
-                    materials_created.append(material_name)
-                    print(f"Successfully created material: {material_name}")
-                except Exception as e:
-                    print(f"Error creating material {material_name}: {e}")
+            try:
+                # Create a new material with default settings
+                mat = bpy.data.materials.new(name=material_name)
+                mat.use_nodes = True
+                materials_created.append(material_name)
+                print(f"Successfully created material: {material_name}")
+            except Exception as e:
+                print(f"Error creating material {material_name}: {e}")
 
         # List materials after creation to verify
         new_materials = list(bpy.data.materials.keys())
@@ -323,7 +486,7 @@ def create_simple_materials(parts_data, object_name):
 
     except Exception as e:
         print(f"ERROR creating materials: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
+        traceback.print_exc()
         return []
 
 def assign_materials_to_object(material_names, obj):
@@ -341,16 +504,18 @@ def assign_materials_to_object(material_names, obj):
         print(f"Cleared existing materials")
 
         # Add each material to the object
+        obj_materials = obj.data.materials
+        append = obj_materials.append
         for mat_name in material_names:
-            if mat_name in bpy.data.materials:
-                # Get the material
-                mat = bpy.data.materials[mat_name]
-
-                # Append the material to the object's materials
-                obj.data.materials.append(mat)
-                print(f"Assigned material {mat_name} to slot {len(obj.data.materials)-1}")
-            else:
+            # Get the material with a single lookup
+            mat = bpy.data.materials.get(mat_name)
+            if mat is None:
                 print(f"Material {mat_name} not found in bpy.data.materials")
+                continue
+
+            # Append the material to the object's materials
+            append(mat)
+            print(f"Assigned material {mat_name} to slot {len(obj_materials)-1}")
 
         # Make sure the object uses material slots
         if hasattr(obj, 'material_slots') and len(obj.material_slots) > 0:
@@ -366,7 +531,7 @@ def assign_materials_to_object(material_names, obj):
 
     except Exception as e:
         print(f"ERROR assigning materials: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
+        traceback.print_exc()
         return False
 
 def main():
@@ -377,12 +542,16 @@ def main():
         if bpy.app.background:
             print("WARNING: Blender is running in background mode, no UI updates will be visible")
 
+        # Resolve the active object once for the whole run
+        obj = bpy.context.active_object
+
         # Check if an object is selected
-        if not bpy.context.active_object:
+        if not obj:
             print("ERROR: No active object selected. Please select an object before running the script.")
             print("The script will still create the node group and materials, but won't apply them to any object.")
         else:
-            debug_print(f"Active object: {bpy.context.active_object.name}")
+            if DEBUG:
+                debug_print(f"Active object: {obj.name}")
 
         # Check if a config path was specified at the top of the script
         if CONFIG_PATH:
@@ -411,7 +580,9 @@ def main():
 
                     # Look for config files in the .blend file directory
                     if os.path.exists(blend_dir):
-                        config_files = [f for f in os.listdir(blend_dir) if f.endswith("_Config.json") or f.endswith("_config.json")]
+                        with os.scandir(blend_dir) as entries:
+                            config_files = [e.name for e in entries
+                                            if e.is_file() and e.name.lower().endswith("_config.json")]
 
                         if not config_files:
                             print("ERROR: No config files found in the Blender file directory.")
@@ -431,40 +602,39 @@ def main():
                         return
                 except Exception as e:
                     print(f"Error finding config file: {e}")
-                    print(f"Traceback: {traceback.format_exc()}")
+                    traceback.print_exc()
                     print("Please specify a config file path at the top of the script.")
                     return
 
         # Load the config file
-        node_group = load_config_file(config_path)
+        node_group = load_config_file(config_path, obj)
 
         # Add the node group to the active object if one exists
-        if node_group and bpy.context.active_object:
-            debug_print(f"Adding node group to active object: {bpy.context.active_object.name}")
+        if node_group and obj:
+            if DEBUG:
+                debug_print(f"Adding node group to active object: {obj.name}")
 
             # Check if the object already has a geometry nodes modifier
-            modifier = None
-            for mod in bpy.context.active_object.modifiers:
-                if mod.type == 'NODES':
-                    modifier = mod
-                    debug_print(f"Found existing geometry nodes modifier: {mod.name}")
-                    break
+            modifier = next((mod for mod in obj.modifiers if mod.type == 'NODES'), None)
+            if modifier and DEBUG:
+                debug_print(f"Found existing geometry nodes modifier: {modifier.name}")
 
             # If no modifier exists, create one
             if not modifier:
                 debug_print("Creating new geometry nodes modifier")
-                modifier = bpy.context.active_object.modifiers.new(name=node_group.name, type='NODES')
+                modifier = obj.modifiers.new(name=node_group.name, type='NODES')
 
             # Set the node group
-            debug_print(f"Setting node group: {node_group.name}")
+            if DEBUG:
+                debug_print(f"Setting node group: {node_group.name}")
             modifier.node_group = node_group
 
-            print(f"Successfully applied node group '{node_group.name}' to object '{bpy.context.active_object.name}'")
+            print(f"Successfully applied node group '{node_group.name}' to object '{obj.name}'")
             print("You can find the parameters in the modifier panel of the active object")
         else:
             if not node_group:
                 print("Failed to create node group.")
-            if not bpy.context.active_object:
+            if not obj:
                 print("No active object selected. The node group was created but not applied to any object.")
                 print("To use the node group, select an object and add a Geometry Nodes modifier, then select the node group.")
 
@@ -472,7 +642,7 @@ def main():
 
     except Exception as e:
         print(f"ERROR in main function: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
+        traceback.print_exc()
 
 if __name__ == "__main__":
     main()